@@ -12,7 +12,7 @@ import MuyGPyS._src.math.jax as jnp
 
 @jit
 def _rbf_fn(squared_dists: jnp.ndarray, **kwargs) -> jnp.ndarray:
-    return jnp.exp(-squared_dists / 2)
+    return jnp.exp(squared_dists * -0.5)
 
 
 @jit
@@ -34,7 +34,7 @@ def _matern_25_fn(dists: jnp.ndarray, **kwargs) -> jnp.ndarray:
 
 @jit
 def _matern_inf_fn(dists: jnp.ndarray, **kwargs) -> jnp.ndarray:
-    return jnp.exp(-(dists**2) / 2.0)
+    return jnp.exp(dists**2 * -0.5)
 
 
 @jit
@@ -4,40 +4,121 @@
 # SPDX-License-Identifier: MIT
 
 
-from scipy.special import gamma, kv
+from scipy.special import gammaln, kv
 
 import MuyGPyS._src.math.numpy as np
 
 
 def _rbf_fn(squared_dists: np.ndarray, **kwargs) -> np.ndarray:
-    return np.exp(-squared_dists / 2.0)
+    K = squared_dists * -0.5
+    np.exp(K, out=K)
+    return K
 
 
 def _matern_05_fn(dists: np.ndarray, **kwargs) -> np.ndarray:
-    return np.exp(-dists)
+    K = np.negative(dists)
+    np.exp(K, out=K)
+    return K
 
 
 def _matern_15_fn(dists: np.ndarray, **kwargs) -> np.ndarray:
     K = dists * np.sqrt(3)
-    return (1.0 + K) * np.exp(-K)
+    ret = np.negative(K)
+    np.exp(ret, out=ret)
+    K += 1.0
+    ret *= K
+    return ret
 
 
 def _matern_25_fn(dists: np.ndarray, **kwargs) -> np.ndarray:
     K = dists * np.sqrt(5)
-    return (1.0 + K + K**2 / 3.0) * np.exp(-K)
+    E = np.negative(K)
+    np.exp(E, out=E)
+    # 1 + K + K^2 / 3 in Horner form
+    ret = K / 3.0
+    ret += 1.0
+    ret *= K
+    ret += 1.0
+    ret *= E
+    return ret
 
 
 def _matern_inf_fn(dists: np.ndarray, **kwargs) -> np.ndarray:
-    return np.exp(-(dists**2) / 2.0)
+    K = dists**2
+    K *= -0.5
+    np.exp(K, out=K)
+    return K
 
 
 def _matern_gen_fn(
     dists: np.ndarray, smoothness: float, **kwargs
 ) -> np.ndarray:
-    K = dists
-    K[K == 0.0] += np.finfo(float).eps
-    tmp = np.sqrt(2 * smoothness) * K
-    K.fill((2 ** (1.0 - smoothness)) / gamma(smoothness))
-    K *= tmp**smoothness
-    K *= kv(smoothness, tmp)
+    if (
+        dists.ndim > 1
+        and dists.shape[-2] == dists.shape[-1]
+        and np.array_equal(dists, dists.swapaxes(-1, -2))
+    ):
+        # kv dominates the cost, so only evaluate the upper triangle of
+        # symmetric (e.g. pairwise) distance tensors and mirror it
+        rows, cols = np.triu_indices(dists.shape[-1])
+        K = np.empty(dists.shape, dtype=dists.dtype)
+        K[..., rows, cols] = K[..., cols, rows] = _matern_gen_elementwise_fn(
+            dists[..., rows, cols], smoothness
+        )
+        return K
+    return _matern_gen_elementwise_fn(dists, smoothness)
+
+
+def _matern_gen_elementwise_fn(
+    dists: np.ndarray, smoothness: float
+) -> np.ndarray:
+    # clamp with a scalar of the input dtype so float32 inputs stay float32
+    tmp = np.maximum(dists, dists.dtype.type(np.finfo(float).eps))
+    tmp *= np.sqrt(2 * smoothness)
+    # Evaluate in log space so that neither the power, the Bessel function nor
+    # gamma(smoothness) overflows on its own for large smoothness. K and tmp
+    # are reused as output buffers to avoid further full-size temporaries.
+    K = kv(smoothness, tmp)
+    # kv overflows for large smoothness at small distances, where its large
+    # order expansion is accurate
+    overflow = np.isinf(K)
+    # kv underflows to zero at large distances, where the kernel is zero too
+    with np.errstate(divide="ignore"):
+        np.log(K, out=K)
+    if overflow.any():
+        K[overflow] = _log_kv_large_order(smoothness, tmp[overflow])
+    np.log(tmp, out=tmp)
+    tmp *= smoothness
+    K += tmp
+    K += (1.0 - smoothness) * np.log(2.0) - gammaln(smoothness)
+    np.exp(K, out=K)
+    # the kernel is bounded by its value of one at zero distance, which
+    # rounding in the log space evaluation can slightly overshoot
+    np.minimum(K, 1.0, out=K)
+    K[dists == 0.0] = 1.0
     return K
+
+
+def _log_kv_large_order(smoothness: float, x: np.ndarray) -> np.ndarray:
+    # uniform asymptotic (Debye) expansion of log K_nu(nu * z), truncated
+    # after the third order term, see DLMF 10.41.4 and 10.41.10
+    z = x / smoothness
+    s = np.sqrt(1.0 + z**2)
+    t = 1.0 / s
+    t2 = t**2
+    eta = s + np.log(z / (1.0 + s))
+    u1 = t * (3.0 - 5.0 * t2) / 24.0
+    u2 = t2 * (81.0 - 462.0 * t2 + 385.0 * t2**2) / 1152.0
+    u3 = (
+        t
+        * t2
+        * (30375.0 - t2 * (369603.0 - t2 * (765765.0 - 425425.0 * t2)))
+        / 414720.0
+    )
+    series = 1.0 - (u1 - (u2 - u3 / smoothness) / smoothness) / smoothness
+    return (
+        0.5 * np.log(np.pi / (2.0 * smoothness))
+        - smoothness * eta
+        - 0.5 * np.log(s)
+        + np.log(series)
+    )
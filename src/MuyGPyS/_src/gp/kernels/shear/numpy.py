@@ -7,254 +7,179 @@
 import MuyGPyS._src.math.numpy as np
 
 
-def _kk_fn(
-    exp_inv_scaled_sum_sq_diffs,
-    sum_sq_diffs,
-    prod_sq_diffs,
-    sum_quad_diffs,
-    length_scale=1.0,
-):
-    return 0.25 * (
-        (
-            8 * length_scale**2
-            - 8 * length_scale * sum_sq_diffs
-            + 2 * prod_sq_diffs
-            + sum_quad_diffs
-        )
-        * exp_inv_scaled_sum_sq_diffs
-        / length_scale**4
-    )
+# The six unique kernel blocks are polynomials in the per-pair quantities
+# sum_sq_diffs = dx^2 + dy^2, diff_xy_sq_diffs = dx^2 - dy^2, and
+# prod_diffs = dx * dy, all scaled by a common exponential prefactor, so we
+# compute only these intermediates and reuse them.
+def _shear_features(diffs, length_scale=1.0):
+    prod_diffs = diffs[..., 0] * diffs[..., 1]
+    sq_diffs = diffs**2
+    sum_sq_diffs = sq_diffs[..., 0] + sq_diffs[..., 1]
+    diff_xy_sq_diffs = sq_diffs[..., 0] - sq_diffs[..., 1]
+    # exponentiate in place on a fresh contiguous buffer of the input dtype
+    prefactor = sum_sq_diffs * (-0.5 / length_scale)
+    np.exp(prefactor, out=prefactor)
+    prefactor *= 0.25 / length_scale**4
+    return prefactor, sum_sq_diffs, diff_xy_sq_diffs, prod_diffs
 
 
-def _kg1_fn(
-    exp_inv_scaled_sum_sq_diffs,
-    diff_xy_quad_diffs,
-    diff_yx_sq_diffs,
-    length_scale=1.0,
-):
-    return 0.25 * (
-        (6 * length_scale * diff_yx_sq_diffs + diff_xy_quad_diffs)
-        * exp_inv_scaled_sum_sq_diffs
-        / length_scale**4
-    )
+# Each block is evaluated in place on a single contiguous buffer, which is
+# then stored into its (strided) slot of the output tensor exactly once.
+def _kk_fn(prefactor, sum_sq_diffs, length_scale=1.0):
+    ret = sum_sq_diffs - 8 * length_scale
+    ret *= sum_sq_diffs
+    ret += 8 * length_scale**2
+    ret *= prefactor
+    return ret
 
 
-def _kg2_fn(
-    exp_inv_scaled_sum_sq_diffs,
-    sum_sq_diffs,
-    prod_diffs,
-    length_scale=1.0,
-):
-    return (
-        0.5
-        * prod_diffs
-        * (-6 * length_scale + sum_sq_diffs)
-        * exp_inv_scaled_sum_sq_diffs
-        / length_scale**4
-    )
+def _kg1_fn(prefactor, sum_sq_diffs, diff_xy_sq_diffs, length_scale=1.0):
+    ret = sum_sq_diffs - 6 * length_scale
+    ret *= diff_xy_sq_diffs
+    ret *= prefactor
+    return ret
 
 
-def _g1g1_fn(
-    exp_inv_scaled_sum_sq_diffs,
-    sum_sq_diffs,
-    sum_quad_diffs,
-    prod_sq_diffs,
-    length_scale=1.0,
-):
-    return 0.25 * (
-        (
-            4 * length_scale**2
-            - 4 * length_scale * sum_sq_diffs
-            - 2 * prod_sq_diffs
-            + sum_quad_diffs
-        )
-        * exp_inv_scaled_sum_sq_diffs
-        / length_scale**4
-    )
+def _kg2_fn(prefactor, sum_sq_diffs, prod_diffs, length_scale=1.0):
+    ret = sum_sq_diffs - 6 * length_scale
+    ret *= prod_diffs
+    ret *= prefactor
+    ret *= 2
+    return ret
 
 
-def _g1g2_fn(
-    exp_inv_scaled_sum_sq_diffs,
-    diff_xy_sq_diffs,
-    prod_diffs,
-    length_scale=1.0,
-):
-    return (
-        0.5
-        * prod_diffs
-        * diff_xy_sq_diffs
-        * exp_inv_scaled_sum_sq_diffs
-        / length_scale**4
-    )
+def _g1g1_fn(prefactor, sum_sq_diffs, diff_xy_sq_diffs, length_scale=1.0):
+    ret = sum_sq_diffs - length_scale
+    ret *= -4 * length_scale
+    ret += diff_xy_sq_diffs**2
+    ret *= prefactor
+    return ret
 
 
-def _g2g2_fn(
-    exp_inv_scaled_sum_sq_diffs,
-    sum_sq_diffs,
-    prod_sq_diffs,
-    length_scale=1.0,
-):
-    return (
-        (length_scale**2 - length_scale * sum_sq_diffs + prod_sq_diffs)
-        * exp_inv_scaled_sum_sq_diffs
-        / length_scale**4
-    )
+def _g1g2_fn(prefactor, diff_xy_sq_diffs, prod_diffs):
+    ret = prod_diffs * diff_xy_sq_diffs
+    ret *= prefactor
+    ret *= 2
+    return ret
 
 
-# compute the full covariance matrix for convergence, shear1 and shear2
-def _shear_33_fn(diffs, length_scale=1.0, **kwargs):
+def _g2g2_fn(prefactor, sum_sq_diffs, prod_diffs, length_scale=1.0):
+    ret = sum_sq_diffs - length_scale
+    ret *= -length_scale
+    ret += prod_diffs**2
+    ret *= prefactor
+    ret *= 4
+    return ret
+
+
+# The shear blocks are evaluated in chunks along the flattened batch
+# dimension(s), so that the intermediates of each chunk stay cache-resident
+# while all of the chunk's output blocks are written. Each chunk holds roughly
+# this many (n, m) difference pairs.
+_CHUNK_PAIRS = 4096
+
+
+def _shear_chunked_fn(fill_fn, diffs, length_scale, out_rows, out_cols):
     assert diffs.ndim >= 3
     shape = diffs.shape[:-1]
     n = shape[-2]
     m = shape[-1]
     prefix = shape[:-2]
-    new_shape = prefix + (3, n, 3, m)
-    full_m = np.zeros(new_shape)
+    new_shape = prefix + (out_rows, n, out_cols, m)
+    full_m = np.empty(new_shape)
+
+    # empty inputs have nothing to fill, and no well-defined chunk size
+    if full_m.size > 0:
+        flat_diffs = diffs.reshape((-1, n, m, diffs.shape[-1]))
+        flat_m = full_m.reshape((-1, out_rows, n, out_cols, m))
+        step = max(1, _CHUNK_PAIRS // (n * m))
+        for i in range(0, flat_diffs.shape[0], step):
+            fill_fn(
+                flat_m[i : i + step], flat_diffs[i : i + step], length_scale
+            )
 
+    if 1 in new_shape:
+        return np.squeeze(full_m)
+    return full_m
+
+
+def _fill_shear_33(full_m, diffs, length_scale):
     # compute intermediate difference tensors once here
-    prod_diffs = np.prod(diffs, axis=-1)
-    sq_diffs = diffs**2
-    quad_diffs = sq_diffs**2
-    sum_sq_diffs = np.sum(sq_diffs, axis=-1)
-    prod_sq_diffs = np.prod(sq_diffs, axis=-1)
-    sum_quad_diffs = np.sum(quad_diffs, axis=-1)
-    diff_yx_sq_diffs = sq_diffs[..., 1] - sq_diffs[..., 0]
-    diff_xy_sq_diffs = sq_diffs[..., 0] - sq_diffs[..., 1]
-    diff_xy_quad_diffs = quad_diffs[..., 0] - quad_diffs[..., 1]
-    exp_inv_scaled_sum_sq_diffs = np.exp(-sum_sq_diffs / (2 * length_scale))
+    prefactor, sum_sq_diffs, diff_xy_sq_diffs, prod_diffs = _shear_features(
+        diffs, length_scale
+    )
 
     full_m[..., 0, :, 0, :] = _kk_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        sum_sq_diffs,
-        prod_sq_diffs,
-        sum_quad_diffs,
-        length_scale,
+        prefactor, sum_sq_diffs, length_scale
     )  # (0, 0)
     full_m[..., 0, :, 1, :] = full_m[..., 1, :, 0, :] = _kg1_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        diff_xy_quad_diffs,
-        diff_yx_sq_diffs,
-        length_scale,
+        prefactor, sum_sq_diffs, diff_xy_sq_diffs, length_scale
     )  # (0, 1), (1, 0)
     full_m[..., 0, :, 2, :] = full_m[..., 2, :, 0, :] = _kg2_fn(
-        exp_inv_scaled_sum_sq_diffs, sum_sq_diffs, prod_diffs, length_scale
+        prefactor, sum_sq_diffs, prod_diffs, length_scale
     )  # (0, 2), (2, 0)
     full_m[..., 1, :, 1, :] = _g1g1_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        sum_sq_diffs,
-        sum_quad_diffs,
-        prod_sq_diffs,
-        length_scale,
+        prefactor, sum_sq_diffs, diff_xy_sq_diffs, length_scale
     )  # (1, 1)
     full_m[..., 1, :, 2, :] = full_m[..., 2, :, 1, :] = _g1g2_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        diff_xy_sq_diffs,
-        prod_diffs,
-        length_scale,
+        prefactor, diff_xy_sq_diffs, prod_diffs
     )  # (1, 2), (2, 1)
     full_m[..., 2, :, 2, :] = _g2g2_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        sum_sq_diffs,
-        prod_sq_diffs,
-        length_scale,
+        prefactor, sum_sq_diffs, prod_diffs, length_scale
     )  # (2, 2)
 
-    return np.squeeze(full_m)
-
-
-# compute the full covariance matrix for shear1 and shear2 only
-def _shear_Kin23_fn(diffs, length_scale=1.0, **kwargs):
-    assert diffs.ndim >= 3
-    shape = diffs.shape[:-1]
-    n = shape[-2]
-    m = shape[-1]
-    prefix = shape[:-2]
-    new_shape = prefix + (2, n, 2, m)
-    full_m = np.zeros(new_shape)
 
+def _fill_shear_Kin23(full_m, diffs, length_scale):
     # compute intermediate difference tensors once here
-    prod_diffs = np.prod(diffs, axis=-1)
-    sq_diffs = diffs**2
-    quad_diffs = sq_diffs**2
-    sum_sq_diffs = np.sum(sq_diffs, axis=-1)
-    prod_sq_diffs = np.prod(sq_diffs, axis=-1)
-    sum_quad_diffs = np.sum(quad_diffs, axis=-1)
-    diff_xy_sq_diffs = sq_diffs[..., 0] - sq_diffs[..., 1]
-    exp_inv_scaled_sum_sq_diffs = np.exp(-sum_sq_diffs / (2 * length_scale))
+    prefactor, sum_sq_diffs, diff_xy_sq_diffs, prod_diffs = _shear_features(
+        diffs, length_scale
+    )
 
     full_m[..., 0, :, 0, :] = _g1g1_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        sum_sq_diffs,
-        sum_quad_diffs,
-        prod_sq_diffs,
-        length_scale,
+        prefactor, sum_sq_diffs, diff_xy_sq_diffs, length_scale
     )  # (0, 0)
     full_m[..., 0, :, 1, :] = full_m[..., 1, :, 0, :] = _g1g2_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        diff_xy_sq_diffs,
-        prod_diffs,
-        length_scale,
+        prefactor, diff_xy_sq_diffs, prod_diffs
     )  # (0, 1), (1, 0)
     full_m[..., 1, :, 1, :] = _g2g2_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        sum_sq_diffs,
-        prod_sq_diffs,
-        length_scale,
+        prefactor, sum_sq_diffs, prod_diffs, length_scale
     )  # (1, 1)
 
-    return np.squeeze(full_m)
-
-
-# compute the crosscovariance matrix relating shear1 and shear2 only
-# observations to convergence, shear1 and shear2 predictions.
-def _shear_Kcross23_fn(diffs, length_scale=1.0, **kwargs):
-    assert diffs.ndim >= 3
-    shape = diffs.shape[:-1]
-    n = shape[-2]
-    m = shape[-1]
-    prefix = shape[:-2]
-    new_shape = prefix + (2, n, 3, m)
-    full_m = np.zeros(new_shape)
 
+def _fill_shear_Kcross23(full_m, diffs, length_scale):
     # compute intermediate difference tensors once here
-    prod_diffs = np.prod(diffs, axis=-1)
-    sq_diffs = diffs**2
-    quad_diffs = sq_diffs**2
-    sum_sq_diffs = np.sum(sq_diffs, axis=-1)
-    prod_sq_diffs = np.prod(sq_diffs, axis=-1)
-    sum_quad_diffs = np.sum(quad_diffs, axis=-1)
-    diff_yx_sq_diffs = sq_diffs[..., 1] - sq_diffs[..., 0]
-    diff_xy_sq_diffs = sq_diffs[..., 0] - sq_diffs[..., 1]
-    diff_xy_quad_diffs = quad_diffs[..., 0] - quad_diffs[..., 1]
-    exp_inv_scaled_sum_sq_diffs = np.exp(-sum_sq_diffs / (2 * length_scale))
+    prefactor, sum_sq_diffs, diff_xy_sq_diffs, prod_diffs = _shear_features(
+        diffs, length_scale
+    )
 
     full_m[..., 0, :, 0, :] = _kg1_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        diff_xy_quad_diffs,
-        diff_yx_sq_diffs,
-        length_scale,
+        prefactor, sum_sq_diffs, diff_xy_sq_diffs, length_scale
     )  # (0, 0)
     full_m[..., 1, :, 0, :] = _kg2_fn(
-        exp_inv_scaled_sum_sq_diffs, sum_sq_diffs, prod_diffs, length_scale
+        prefactor, sum_sq_diffs, prod_diffs, length_scale
     )  # (1, 0)
     full_m[..., 0, :, 1, :] = _g1g1_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        sum_sq_diffs,
-        sum_quad_diffs,
-        prod_sq_diffs,
-        length_scale,
+        prefactor, sum_sq_diffs, diff_xy_sq_diffs, length_scale
     )  # (0, 1)
     full_m[..., 0, :, 2, :] = full_m[..., 1, :, 1, :] = _g1g2_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        diff_xy_sq_diffs,
-        prod_diffs,
-        length_scale,
+        prefactor, diff_xy_sq_diffs, prod_diffs
     )  # (0, 2), (1, 1)
     full_m[..., 1, :, 2, :] = _g2g2_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        sum_sq_diffs,
-        prod_sq_diffs,
-        length_scale,
+        prefactor, sum_sq_diffs, prod_diffs, length_scale
     )  # (1, 2)
 
-    return np.squeeze(full_m)
+
+# compute the full covariance matrix for convergence, shear1 and shear2
+def _shear_33_fn(diffs, length_scale=1.0, **kwargs):
+    return _shear_chunked_fn(_fill_shear_33, diffs, length_scale, 3, 3)
+
+
+# compute the full covariance matrix for shear1 and shear2 only
+def _shear_Kin23_fn(diffs, length_scale=1.0, **kwargs):
+    return _shear_chunked_fn(_fill_shear_Kin23, diffs, length_scale, 2, 2)
+
+
+# compute the crosscovariance matrix relating shear1 and shear2 only
+# observations to convergence, shear1 and shear2 predictions.
+def _shear_Kcross23_fn(diffs, length_scale=1.0, **kwargs):
+    return _shear_chunked_fn(_fill_shear_Kcross23, diffs, length_scale, 2, 3)
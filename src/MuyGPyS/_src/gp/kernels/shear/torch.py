@@ -7,97 +7,51 @@
 import MuyGPyS._src.math.torch as torch
 
 
-def _kk_fn(
-    exp_inv_scaled_sum_sq_diffs,
-    sum_sq_diffs,
-    prod_sq_diffs,
-    sum_quad_diffs,
-    length_scale=1.0,
-):
-    return 0.25 * (
-        (
-            8 * length_scale**2
-            - 8 * length_scale * sum_sq_diffs
-            + 2 * prod_sq_diffs
-            + sum_quad_diffs
-        )
-        * exp_inv_scaled_sum_sq_diffs
-        / length_scale**4
+# see the numpy implementation for the shared per-pair intermediates
+def _shear_features(diffs, length_scale=1.0):
+    prod_diffs = diffs[..., 0] * diffs[..., 1]
+    sq_diffs = diffs**2
+    sum_sq_diffs = sq_diffs[..., 0] + sq_diffs[..., 1]
+    diff_xy_sq_diffs = sq_diffs[..., 0] - sq_diffs[..., 1]
+    # fold the length scale into scalar constants so that each is applied to
+    # the difference tensors only once
+    prefactor = (0.25 / length_scale**4) * torch.exp(
+        sum_sq_diffs * (-0.5 / length_scale)
     )
+    return prefactor, sum_sq_diffs, diff_xy_sq_diffs, prod_diffs
 
 
-def _kg1_fn(
-    exp_inv_scaled_sum_sq_diffs,
-    diff_xy_quad_diffs,
-    diff_yx_sq_diffs,
-    length_scale=1.0,
-):
-    return 0.25 * (
-        (6 * length_scale * diff_yx_sq_diffs + diff_xy_quad_diffs)
-        * exp_inv_scaled_sum_sq_diffs
-        / length_scale**4
+def _kk_fn(prefactor, sum_sq_diffs, length_scale=1.0):
+    return prefactor * (
+        8 * length_scale**2 - 8 * length_scale * sum_sq_diffs + sum_sq_diffs**2
     )
 
 
-def _kg2_fn(
-    exp_inv_scaled_sum_sq_diffs,
-    sum_sq_diffs,
-    prod_diffs,
-    length_scale=1.0,
-):
-    return (
-        0.5
-        * prod_diffs
-        * (-6 * length_scale + sum_sq_diffs)
-        * exp_inv_scaled_sum_sq_diffs
-        / length_scale**4
-    )
+def _kg1_fn(prefactor, sum_sq_diffs, diff_xy_sq_diffs, length_scale=1.0):
+    return prefactor * diff_xy_sq_diffs * (sum_sq_diffs - 6 * length_scale)
 
 
-def _g1g1_fn(
-    exp_inv_scaled_sum_sq_diffs,
-    sum_sq_diffs,
-    sum_quad_diffs,
-    prod_sq_diffs,
-    length_scale=1.0,
-):
-    return 0.25 * (
-        (
-            4 * length_scale**2
-            - 4 * length_scale * sum_sq_diffs
-            - 2 * prod_sq_diffs
-            + sum_quad_diffs
-        )
-        * exp_inv_scaled_sum_sq_diffs
-        / length_scale**4
-    )
+def _kg2_fn(prefactor, sum_sq_diffs, prod_diffs, length_scale=1.0):
+    return 2 * prefactor * prod_diffs * (sum_sq_diffs - 6 * length_scale)
 
 
-def _g1g2_fn(
-    exp_inv_scaled_sum_sq_diffs,
-    diff_xy_sq_diffs,
-    prod_diffs,
-    length_scale=1.0,
-):
-    return (
-        0.5
-        * prod_diffs
-        * diff_xy_sq_diffs
-        * exp_inv_scaled_sum_sq_diffs
-        / length_scale**4
+def _g1g1_fn(prefactor, sum_sq_diffs, diff_xy_sq_diffs, length_scale=1.0):
+    return prefactor * (
+        4 * length_scale**2
+        - 4 * length_scale * sum_sq_diffs
+        + diff_xy_sq_diffs**2
     )
 
 
-def _g2g2_fn(
-    exp_inv_scaled_sum_sq_diffs,
-    sum_sq_diffs,
-    prod_sq_diffs,
-    length_scale=1.0,
-):
+def _g1g2_fn(prefactor, diff_xy_sq_diffs, prod_diffs):
+    return 2 * prefactor * prod_diffs * diff_xy_sq_diffs
+
+
+def _g2g2_fn(prefactor, sum_sq_diffs, prod_diffs, length_scale=1.0):
     return (
-        (length_scale**2 - length_scale * sum_sq_diffs + prod_sq_diffs)
-        * exp_inv_scaled_sum_sq_diffs
-        / length_scale**4
+        4
+        * prefactor
+        * (length_scale**2 - length_scale * sum_sq_diffs + prod_diffs**2)
     )
 
 
@@ -112,51 +66,27 @@ def _shear_33_fn(diffs, length_scale=1, **kwargs):
     full_m = torch.zeros(new_shape)
 
     # compute intermediate difference tensors once here
-    prod_diffs = torch.prod(diffs, axis=-1)
-    sq_diffs = diffs**2
-    quad_diffs = sq_diffs**2
-    sum_sq_diffs = torch.sum(sq_diffs, axis=-1)
-    prod_sq_diffs = torch.prod(sq_diffs, axis=-1)
-    sum_quad_diffs = torch.sum(quad_diffs, axis=-1)
-    diff_yx_sq_diffs = sq_diffs[..., 1] - sq_diffs[..., 0]
-    diff_xy_sq_diffs = sq_diffs[..., 0] - sq_diffs[..., 1]
-    diff_xy_quad_diffs = quad_diffs[..., 0] - quad_diffs[..., 1]
-    exp_inv_scaled_sum_sq_diffs = torch.exp(-sum_sq_diffs / (2 * length_scale))
+    prefactor, sum_sq_diffs, diff_xy_sq_diffs, prod_diffs = _shear_features(
+        diffs, length_scale
+    )
 
     full_m[..., 0, :, 0, :] = _kk_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        sum_sq_diffs,
-        prod_sq_diffs,
-        sum_quad_diffs,
-        length_scale,
+        prefactor, sum_sq_diffs, length_scale
     )  # (0, 0)
     full_m[..., 0, :, 1, :] = full_m[..., 1, :, 0, :] = _kg1_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        diff_xy_quad_diffs,
-        diff_yx_sq_diffs,
-        length_scale,
+        prefactor, sum_sq_diffs, diff_xy_sq_diffs, length_scale
     )  # (0, 1), (1, 0)
     full_m[..., 0, :, 2, :] = full_m[..., 2, :, 0, :] = _kg2_fn(
-        exp_inv_scaled_sum_sq_diffs, sum_sq_diffs, prod_diffs, length_scale
+        prefactor, sum_sq_diffs, prod_diffs, length_scale
     )  # (0, 2), (2, 0)
     full_m[..., 1, :, 1, :] = _g1g1_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        sum_sq_diffs,
-        sum_quad_diffs,
-        prod_sq_diffs,
-        length_scale,
+        prefactor, sum_sq_diffs, diff_xy_sq_diffs, length_scale
     )  # (1, 1)
     full_m[..., 1, :, 2, :] = full_m[..., 2, :, 1, :] = _g1g2_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        diff_xy_sq_diffs,
-        prod_diffs,
-        length_scale,
+        prefactor, diff_xy_sq_diffs, prod_diffs
     )  # (1, 2), (2, 1)
     full_m[..., 2, :, 2, :] = _g2g2_fn(
-        exp_inv_scaled_sum_sq_diffs,
-        sum_sq_diffs,
-        prod_sq_diffs,
-        length_scale,
+        prefactor, sum_sq_diffs, prod_diffs, length_scale
     )  # (2, 2)
 
     return full_m
@@ -2,7 +2,7 @@ import MuyGPyS._src.math.torch as torch
 
 
 def _rbf_fn(squared_dists: torch.ndarray, **kwargs) -> torch.ndarray:
-    return torch.exp(-squared_dists / 2.0)
+    return torch.exp(squared_dists * -0.5)
 
 
 def _matern_05_fn(dists: torch.ndarray, **kwargs) -> torch.ndarray:
@@ -20,7 +20,7 @@ def _matern_25_fn(dists: torch.ndarray, **kwargs) -> torch.ndarray:
 
 
 def _matern_inf_fn(dists: torch.ndarray, **kwargs) -> torch.ndarray:
-    return torch.exp(-(dists**2) / 2.0)
+    return torch.exp(dists**2 * -0.5)
 
 
 def _matern_gen_fn(
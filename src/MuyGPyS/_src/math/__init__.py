@@ -21,6 +21,7 @@ from MuyGPyS._src.util import _collect_implementation
     exp,
     diagonal,
     divide,
+    einsum,
     iarray,
     inf,
     int32,
@@ -72,6 +73,7 @@ from MuyGPyS._src.util import _collect_implementation
     "exp",
     "diagonal",
     "divide",
+    "einsum",
     "iarray",
     "inf",
     "int32",
@@ -9,6 +9,7 @@ from numpy import (
     any,
     argmax,
     argmin,
+    array_equal,
     atleast_1d,
     atleast_2d,
     atleast_3d,
@@ -23,6 +24,7 @@ from numpy import (
     dot,
     einsum,
     equal,
+    errstate,
     exp,
     expand_dims,
     finfo,
@@ -34,21 +36,27 @@ from numpy import (
     int32,
     int64,
     isclose,
+    isfinite,
+    isinf,
     isnan,
     linalg,
     log,
     logical_and,
     logical_or,
     max,
+    maximum,
     mean,
     median,
     meshgrid,
     min,
+    minimum,
     mod,
     nan,
     ndarray,
+    negative,
     number,
     outer,
+    pi,
     prod,
     random,
     repeat,
@@ -58,6 +66,7 @@ from numpy import (
     subtract,
     sum,
     tile,
+    triu_indices,
     unique,
     where,
     vstack,
@@ -66,6 +75,7 @@ from numpy import (
     arange as _arange,
     array as _array,
     diagonal as _diagonal,
+    empty as _empty,
     eye as _eye,
     full as _full,
     linspace as _linspace,
@@ -98,8 +108,8 @@ farray = fix_function_type(ftype, _array)
 array = farray
 
 arange = fix_function_type(itype, _arange)
-diagonal, eye, full, linspace, ones, zeros = fix_function_types(
-    ftype, _diagonal, _eye, _full, _linspace, _ones, _zeros
+diagonal, empty, eye, full, linspace, ones, zeros = fix_function_types(
+    ftype, _diagonal, _empty, _eye, _full, _linspace, _ones, _zeros
 )
 
 
@@ -3,7 +3,7 @@
 #
 # SPDX-License-Identifier: MIT
 
-from typing import Callable, Dict, Generator, Optional, Tuple, Type, Union
+from typing import Callable, Dict, Optional, Tuple, Type, Union
 
 import MuyGPyS._src.math as mm
 import MuyGPyS._src.math.numpy as np
@@ -76,6 +76,7 @@ def _sq_rel_err(
 def _make_gaussian_matrix(
     data_count: int,
     feature_count: int,
+    rng: Optional[np.random.Generator] = None,
 ) -> mm.ndarray:
     """
     Create a matrix of i.i.d. Gaussian datapoints.
@@ -85,11 +86,16 @@ def _make_gaussian_matrix(
             The number of data rows.
         feature_count:
             The number of data columns.
+        rng:
+            An optional random number generator. If `None`, draw from the
+            global numpy random state.
 
     Returns:
         An i.i.d. Gaussian matrix of shape `(data_count, feature_count)`.
     """
-    return mm.array(np.random.randn(data_count, feature_count))
+    if rng is None:
+        return mm.array(np.random.randn(data_count, feature_count))
+    return mm.array(rng.standard_normal((data_count, feature_count)))
 
 
 def _make_uniform_matrix(
@@ -116,6 +122,7 @@ def _make_gaussian_dict(
     feature_count: int,
     response_count: int,
     categorical: bool = False,
+    rng: Optional[np.random.Generator] = None,
 ) -> Dict[str, mm.ndarray]:
     """
     Create a data dict including "input", "output", and "labels" keys mapping to
@@ -131,14 +138,17 @@ def _make_gaussian_dict(
         categorical:
             If `True`, convert the `data["output"]` matrix to a one-hot encoding
             matrix.
+        rng:
+            An optional random number generator. If `None`, draw from the
+            global numpy random state.
 
     Returns:
         A dict with keys `"input"` mapping to a `(data_count, feature_count)`
         matrix, `"output"` mapping to a `(data_count, response_count)` matrix,
         and `"labels"` mapping to a `(data_count)` vector.
     """
-    locations = _make_gaussian_matrix(data_count, feature_count)
-    observations = _make_gaussian_matrix(data_count, response_count)
+    locations = _make_gaussian_matrix(data_count, feature_count, rng=rng)
+    observations = _make_gaussian_matrix(data_count, response_count, rng=rng)
     labels = mm.argmax(observations, axis=1)
     if categorical is True:
         observations = mm.eye(response_count)[labels] - (1 / response_count)
@@ -155,6 +165,7 @@ def _make_gaussian_data(
     feature_count: int,
     response_count: int,
     categorical: bool = False,
+    rng: Optional[np.random.Generator] = None,
 ) -> Tuple[Dict[str, mm.ndarray], Dict[str, mm.ndarray]]:
     """
     Create train and test dicts including `"input"`, `"output"`, and `"labels"`
@@ -174,6 +185,9 @@ def _make_gaussian_data(
         categorical:
             If `True`, convert the `data["output"]` matrix to a one-hot encoding
             matrix.
+        rng:
+            An optional random number generator. If `None`, draw from the
+            global numpy random state.
 
     Returns
     -------
@@ -190,10 +204,18 @@ def _make_gaussian_data(
     """
     return (
         _make_gaussian_dict(
-            train_count, feature_count, response_count, categorical=categorical
+            train_count,
+            feature_count,
+            response_count,
+            categorical=categorical,
+            rng=rng,
         ),
         _make_gaussian_dict(
-            test_count, feature_count, response_count, categorical=categorical
+            test_count,
+            feature_count,
+            response_count,
+            categorical=categorical,
+            rng=rng,
         ),
     )
 
@@ -303,40 +325,7 @@ def _get_scale_series(
 ) -> mm.ndarray:
     """
     Return the series of :math:`sigma^2` scale parameters for each neighborhood
-    solve.
-
-    NOTE[bwp]: This function is only for testing purposes.
-
-    Args:
-        Kin:
-            A tensor of shape `(batch_count, nn_count, nn_count)` containing
-            the `(nn_count, nn_count` -shaped kernel matrices corresponding
-            to each of the batch elements.
-        nn_targets:
-            Tensor of floats of shape `(batch_count, nn_count, 1)` containing
-            one dimension of the expected response for each nearest neighbor of
-            each batch element.
-
-    Returns:
-        A vector of shape `(response_count)` listing the value of the scale
-        parameter for the given response dimension.
-    """
-    batch_count, nn_count, _ = nn_targets_column.shape
-
-    scales = np.zeros((batch_count,))
-    for i, el in enumerate(_get_scale(Kin, nn_targets_column, noise_variance)):
-        scales[i] = el
-    return mm.array(scales / nn_count)
-
-
-def _get_scale(
-    Kin: mm.ndarray,
-    nn_targets_column: mm.ndarray,
-    noise_variance: float,
-) -> Generator[float, None, None]:
-    """
-    Generate series of :math:`\\sigma^2` scale parameters for each
-    individual solve along a single dimension:
+    solve:
 
     .. math::
         \\sigma^2 = \\frac{1}{k} * Y_{nn}^T Kin_{nn}^{-1} Y_{nn}
@@ -345,6 +334,8 @@ def _get_scale(
     matrices with respect to the nearest neighbor set in scope, where
     :math:`k` is the number of nearest neighbors.
 
+    NOTE[bwp]: This function is only for testing purposes.
+
     Args:
         Kin:
             A tensor of shape `(batch_count, nn_count, nn_count)` containing
@@ -354,18 +345,21 @@ def _get_scale(
             Tensor of floats of shape `(batch_count, nn_count, 1)` containing
             one dimension of the expected response for each nearest neighbor of
             each batch element.
+        noise_variance:
+            The homoscedastic noise variance, which is added to the diagonal of
+            each kernel matrix before the solve.
 
-    Return:
-        A generator producing `batch_count` optimal values of the
-        :math:`\\sigma^2` variance scale parameter for each neighborhood for the
-        given response dimension.
+    Returns:
+        A vector of shape `(batch_count)` listing the value of the scale
+        parameter of each batch element for the given response dimension.
     """
     batch_count, nn_count, _ = nn_targets_column.shape
-    for j in range(batch_count):
-        Y_0 = nn_targets_column[j, :, 0]
-        yield Y_0 @ mm.linalg.solve(
-            Kin[j, :, :] + noise_variance * mm.eye(nn_count), Y_0
-        )
+
+    # solve all of the neighborhood systems in a single batched call
+    scales = nn_targets_column.swapaxes(-2, -1) @ mm.linalg.solve(
+        Kin + noise_variance * mm.eye(nn_count), nn_targets_column
+    )
+    return mm.array(scales.reshape(batch_count) / nn_count)
 
 
 def _check_ndarray(
@@ -123,10 +123,9 @@ class Parameter:
 
     def _sample_val(self, val: str) -> float:
         if self.fixed() is True:
-            if isinstance(val, str):
-                raise ValueError(
-                    f"Fixed bounds do not support string value ({val}) prompts."
-                )
+            raise ValueError(
+                f"Fixed bounds do not support string value ({val}) prompts."
+            )
         if val == "sample":
             newval = float(
                 np.random.uniform(low=self._bounds[0], high=self._bounds[1])
@@ -171,28 +170,28 @@ class Parameter:
                 A `val` outside of the range specified by `bounds` will
                 produce an error.
         """
+        # dispatch on the type of val once; sampled values are already floats
         if isinstance(val, str):
             val = self._sample_val(val)
-        if isinstance(val, Sequence) or hasattr(val, "__len__"):
+        elif isinstance(val, Sequence) or hasattr(val, "__len__"):
             raise ValueError(
                 f"Nonscalar hyperparameter value {val} is not allowed."
             )
-        if not isinstance(val, mm.ndarray):
+        elif not isinstance(val, mm.ndarray):
             val = float(val)
 
         if self.fixed() is False:
-            any_below = np.any(
-                np.choose(
-                    cast(float, val) < cast(float, self._bounds[0]) - 1e-5,
-                    [False, True],
+            if isinstance(val, float):
+                # plain scalars need no array reduction
+                any_below = val < self._bounds[0] - 1e-5
+                any_above = val > self._bounds[1] + 1e-5
+            else:
+                any_below = np.any(
+                    cast(float, val) < cast(float, self._bounds[0]) - 1e-5
                 )
-            )
-            any_above = np.any(
-                np.choose(
-                    cast(float, val) > cast(float, self._bounds[1]) + 1e-5,
-                    [False, True],
+                any_above = np.any(
+                    cast(float, val) > cast(float, self._bounds[1]) + 1e-5
                 )
-            )
             if any_below:
                 raise ValueError(
                     f"Hyperparameter value {val} is lesser than the "
@@ -145,6 +145,21 @@ class Matern(KernelFn):
             self._predef_fn, self.deformation
         )
 
+    def set_params(self, **kwargs) -> None:
+        """
+        Reset hyperparameters using hyperparameter dict(s).
+
+        The kernel function is specialized to the smoothness at construction
+        time, so resetting `smoothness` also reselects the kernel function.
+
+        Args:
+            kwargs:
+                Hyperparameter kwargs.
+        """
+        super().set_params(**kwargs)
+        if "smoothness" in kwargs:
+            self._make()
+
     def __call__(self, diffs, **kwargs):
         """
         Compute Matern kernels from distance tensor.
@@ -41,6 +41,16 @@ from MuyGPyS._src.gp.kernels.jax import (
     _matern_inf_fn as matern_inf_fn_j,
     _matern_gen_fn as matern_gen_fn_j,
 )
+from MuyGPyS._src.gp.kernels.shear.numpy import (
+    _shear_33_fn as shear_33_fn_n,
+    _shear_Kin23_fn as shear_Kin23_fn_n,
+    _shear_Kcross23_fn as shear_Kcross23_fn_n,
+)
+from MuyGPyS._src.gp.kernels.shear.jax import (
+    _shear_33_fn as shear_33_fn_j,
+    _shear_Kin23_fn as shear_Kin23_fn_j,
+    _shear_Kcross23_fn as shear_Kcross23_fn_j,
+)
 from MuyGPyS._src.gp.muygps.numpy import (
     _muygps_posterior_mean as muygps_posterior_mean_n,
     _muygps_diagonal_variance as muygps_diagonal_variance_n,
@@ -825,6 +835,81 @@ class KernelTest(KernelTestCase):
         )
 
 
+class ShearKernelTest(parameterized.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(ShearKernelTest, cls).setUpClass()
+        cls.train_count = 100
+        cls.batch_count = 10
+        cls.nn_count = 8
+        cls.length_scale = 1.5
+        features_n = _make_gaussian_matrix(cls.train_count, 2)
+        nbrs_lookup = NN_Wrapper(
+            features_n, cls.nn_count, **_exact_nn_kwarg_options[0]
+        )
+        batch_indices_n, batch_nn_indices_n = sample_batch(
+            nbrs_lookup, cls.batch_count, cls.train_count
+        )
+        # batched differences, with the unitary dimension that the shear
+        # kernels insert into crosswise differences
+        cls.diffs_n = {
+            "pairwise": pairwise_tensor_n(features_n, batch_nn_indices_n),
+            "crosswise": crosswise_tensor_n(
+                features_n, features_n, batch_indices_n, batch_nn_indices_n
+            )[..., None, :],
+        }
+        # unbatched differences between one or two sets of points
+        points_n = features_n[: cls.nn_count]
+        other_points_n = features_n[cls.nn_count : cls.nn_count + 3]
+        cls.diffs_n["unbatched_pairwise"] = (
+            points_n[:, None, :] - points_n[None, :, :]
+        )
+        cls.diffs_n["unbatched_crosswise"] = (
+            points_n[:, None, :] - other_points_n[None, :, :]
+        )
+        cls.diffs_j = {
+            name: jnp.array(diffs) for name, diffs in cls.diffs_n.items()
+        }
+
+    def _compare(self, fn_n, fn_j, out_rows, out_cols, diffs_name):
+        diffs_n = self.diffs_n[diffs_name]
+        diffs_j = self.diffs_j[diffs_name]
+        # the numpy kernels squeeze unitary dimensions and the jax kernels do
+        # not, so compare the matrices that callers assemble from the blocks
+        n, m = diffs_n.shape[-3:-1]
+        shape = diffs_n.shape[:-3] + (out_rows * n, out_cols * m)
+        K_n = fn_n(diffs_n, length_scale=self.length_scale)
+        K_j = fn_j(diffs_j, length_scale=self.length_scale)
+        self.assertEqual(K_j.size, np.prod(shape))
+        self.assertTrue(allclose_gen(K_n.reshape(shape), K_j.reshape(shape)))
+
+    @parameterized.parameters(
+        d
+        for d in (
+            "pairwise",
+            "crosswise",
+            "unbatched_pairwise",
+            "unbatched_crosswise",
+        )
+    )
+    def test_shear_33(self, diffs_name):
+        self._compare(shear_33_fn_n, shear_33_fn_j, 3, 3, diffs_name)
+
+    @parameterized.parameters(
+        d for d in ("pairwise", "crosswise", "unbatched_pairwise")
+    )
+    def test_shear_Kin23(self, diffs_name):
+        self._compare(shear_Kin23_fn_n, shear_Kin23_fn_j, 2, 2, diffs_name)
+
+    @parameterized.parameters(
+        d for d in ("crosswise", "pairwise", "unbatched_crosswise")
+    )
+    def test_shear_Kcross23(self, diffs_name):
+        self._compare(
+            shear_Kcross23_fn_n, shear_Kcross23_fn_j, 2, 3, diffs_name
+        )
+
+
 class MuyGPSTestCase(KernelTestCase):
     @classmethod
     def setUpClass(cls):
@@ -9,6 +9,11 @@ from absl.testing import absltest
 
 import MuyGPyS._src.math as mm
 
+from MuyGPyS._src.gp.kernels.shear import (
+    _shear_33_fn,
+    _shear_Kcross23_fn,
+    _shear_Kin23_fn,
+)
 from MuyGPyS.neighbors import NN_Wrapper
 from MuyGPyS._test.utils import _check_ndarray
 from MuyGPyS._test.shear import (
@@ -101,6 +106,38 @@ class KernelTest(KernelTestCase):
         )
 
 
+class EmptyKernelTest(absltest.TestCase):
+    # difference tensor shapes with an empty batch or neighborhood, mapped to
+    # the expected output shapes of the 33, Kin23, and Kcross23 kernels
+    _empty_shapes = {
+        (0, 5, 5, 2): [(0, 3, 5, 3, 5), (0, 2, 5, 2, 5), (0, 2, 5, 3, 5)],
+        (4, 0, 3, 2): [(4, 3, 0, 3, 3), (4, 2, 0, 2, 3), (4, 2, 0, 3, 3)],
+        (1, 0, 3, 2): [(3, 0, 3, 3), (2, 0, 2, 3), (2, 0, 3, 3)],
+        (4, 0, 1, 2): [(4, 3, 0, 3), (4, 2, 0, 2), (4, 2, 0, 3)],
+        (0, 1, 2): [(3, 0, 3), (2, 0, 2), (2, 0, 3)],
+        (0, 3, 2): [(3, 0, 3, 3), (2, 0, 2, 3), (2, 0, 3, 3)],
+    }
+
+    def _empty_chassis(self, kernel_fn, index):
+        for in_shape, out_shapes in self._empty_shapes.items():
+            with self.subTest(shape=in_shape):
+                _check_ndarray(
+                    self.assertEqual,
+                    kernel_fn(mm.zeros(in_shape)),
+                    mm.ftype,
+                    shape=out_shapes[index],
+                )
+
+    def test_empty33(self):
+        self._empty_chassis(_shear_33_fn, 0)
+
+    def test_emptyKin23(self):
+        self._empty_chassis(_shear_Kin23_fn, 1)
+
+    def test_emptyKcross23(self):
+        self._empty_chassis(_shear_Kcross23_fn, 2)
+
+
 class DataTestCase(BenchmarkTestCase):
     @classmethod
     def setUpClass(cls):
@@ -172,7 +172,7 @@ class GPInitTest(parameterized.TestCase):
         #     self.assertEqual(mm.array([1.0]), muygps.scale())
 
     @parameterized.parameters(
-        (kernel, e, gp, 100)
+        (kernel, e, gp)
         for kernel in (
             Matern(
                 smoothness=ScalarParam("sample", (1e-2, 5e4)),
@@ -225,15 +225,16 @@ class GPInitTest(parameterized.TestCase):
         for gp in [MuyGPS]
         # for gp in (MuyGPS, BenchmarkGP)
     )
-    def test_sample_init(self, kernel, noise, gp_type, its):
-        for _ in range(its):
-            muygps = gp_type(kernel=kernel, noise=noise)
-            for name, param in kernel._hyperparameters.items():
-                self._check_in_bounds(
-                    param.get_bounds(),
-                    muygps.kernel._hyperparameters[name],
-                )
-            self._check_in_bounds(noise.get_bounds(), muygps.noise)
+    def test_sample_init(self, kernel, noise, gp_type):
+        # hyperparameters are sampled once when the kernel and noise models are
+        # constructed, so repeated checks of the same object add nothing
+        muygps = gp_type(kernel=kernel, noise=noise)
+        for name, param in kernel._hyperparameters.items():
+            self._check_in_bounds(
+                param.get_bounds(),
+                muygps.kernel._hyperparameters[name],
+            )
+        self._check_in_bounds(noise.get_bounds(), muygps.noise)
 
     def _check_in_bounds(self, given_bounds, param):
         bounds = param.get_bounds()
@@ -243,19 +244,92 @@ class GPInitTest(parameterized.TestCase):
 
 
 class GPTestCase(parameterized.TestCase):
-    def _prepare_tensors(
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # data and nearest neighbors depend only on the problem dimensions, so
+        # they are shared across kernel and noise parameterizations
+        cls._fixtures = dict()
+
+    def _cached_fixture(self, make_fn, dims, nn_count, nn_kwargs):
+        key = (
+            make_fn.__name__,
+            dims,
+            nn_count,
+            tuple(sorted(nn_kwargs.items())),
+        )
+        if key not in self._fixtures:
+            # seed from the problem dimensions so that each fixture is
+            # reproducible independently of test ordering
+            self._fixtures[key] = make_fn(
+                *dims, nn_count, nn_kwargs, rng=np.random.default_rng(dims)
+            )
+        return self._fixtures[key]
+
+    def _get_fixture(
         self,
-        muygps,
         train_count,
         test_count,
         feature_count,
         response_count,
         nn_count,
         nn_kwargs,
+    ):
+        return self._cached_fixture(
+            self._make_fixture,
+            (train_count, test_count, feature_count, response_count),
+            nn_count,
+            nn_kwargs,
+        )
+
+    @staticmethod
+    def _make_fixture(
+        train_count,
+        test_count,
+        feature_count,
+        response_count,
+        nn_count,
+        nn_kwargs,
+        rng,
     ):
         # prepare data
         train, test = _make_gaussian_data(
-            train_count, test_count, feature_count, response_count
+            train_count, test_count, feature_count, response_count, rng=rng
+        )
+
+        # neighbors
+        nbrs_lookup = NN_Wrapper(train["input"], nn_count, **nn_kwargs)
+        test_nn_indices, _ = nbrs_lookup.get_nns(test["input"])
+        indices = mm.arange(test_count)
+        return train, test, test_nn_indices, indices
+
+    def _assert_all_almost_equal(self, first, second, places):
+        # elementwise equivalent of assertAlmostEqual(first, second, places)
+        atol = 0.5 * 10 ** (-places)
+        if not mm.allclose(first, second, rtol=0.0, atol=atol):
+            diffs = first - second
+            self.fail(
+                f"max absolute difference {mm.max(mm.sqrt(diffs**2))} "
+                f"exceeds {atol} ({places} places)"
+            )
+
+    def _prepare_tensors(
+        self,
+        muygps,
+        train_count,
+        test_count,
+        feature_count,
+        response_count,
+        nn_count,
+        nn_kwargs,
+    ):
+        train, test, test_nn_indices, indices = self._get_fixture(
+            train_count,
+            test_count,
+            feature_count,
+            response_count,
+            nn_count,
+            nn_kwargs,
         )
         train_features = train["input"]
         train_responses = train["output"]
@@ -266,10 +340,7 @@ class GPTestCase(parameterized.TestCase):
         _check_ndarray(self.assertEqual, test_features, mm.ftype)
         _check_ndarray(self.assertEqual, test_responses, mm.ftype)
 
-        # neighbors and differences
-        nbrs_lookup = NN_Wrapper(train_features, nn_count, **nn_kwargs)
-        test_nn_indices, _ = nbrs_lookup.get_nns(test_features)
-        indices = mm.arange(test_count)
+        # differences
         _check_ndarray(self.assertEqual, indices, mm.itype)
 
         (
@@ -345,10 +416,12 @@ class GPTensorShapesTest(GPTestCase):
             nn_count,
             nn_kwargs,
         )
-        self.assertTrue(mm.all(Kin >= 0.0))
-        self.assertTrue(mm.all(Kin <= 1.0))
-        self.assertTrue(mm.all(Kcross >= 0.0))
-        self.assertTrue(mm.all(Kcross <= 1.0))
+        # kernel values lie in [0, 1]; check the extrema rather than building
+        # a boolean mask per bound
+        self.assertGreaterEqual(mm.min(Kin), 0.0)
+        self.assertLessEqual(mm.max(Kin), 1.0)
+        self.assertGreaterEqual(mm.min(Kcross), 0.0)
+        self.assertLessEqual(mm.max(Kcross), 1.0)
         # # Check that kernels are positive semidefinite
         if config.state.low_precision() is True:
             _warn0(
@@ -356,27 +429,22 @@ class GPTensorShapesTest(GPTestCase):
                 "skipping tests"
             )
             return
-        for i in range(Kin.shape[0]):
-            eigvals = mm.linalg.eigvals(Kin[..., :, :])
-            # eigvals = mm.array(eigvals, dtype=mm.ftype)
-            eigvals = eigvals.real
-            _check_ndarray(self.assertEqual, eigvals, mm.ftype)
-            self.assertTrue(
-                mm.all(
-                    mm.logical_or(
-                        eigvals >= 0.0,
-                        mm.isclose(eigvals, mm.zeros(eigvals.shape)),
-                    )
-                )
-            )
+        # A batched Cholesky factorization of the (slightly regularized)
+        # kernel tensor only succeeds if every kernel matrix is PSD. Some
+        # backends signal failure with nans rather than raising, so also check
+        # that the factors reproduce the tensor.
+        Kin_reg = Kin + 1e-10 * mm.eye(nn_count)
+        L = mm.cholesky(Kin_reg)
+        _check_ndarray(self.assertEqual, L, mm.ftype)
+        self.assertTrue(mm.allclose(L @ L.swapaxes(-1, -2), Kin_reg))
 
 
 class HomoscedasticNoiseTest(GPTestCase):
     @parameterized.parameters(
         (
             (1000, 100, f, r, 10, nn_kwargs, kwargs)
-            for f in [100, 1]
-            for r in [5, 1]
+            # Kin and Kcross do not depend upon the response count
+            for f, r in [(100, 5), (1, 1)]
             for nn_kwargs in _basic_nn_kwarg_options
             # for f in [1]
             # for r in [1]
@@ -427,8 +495,8 @@ class HeteroscedasticNoiseTest(GPTestCase):
     @parameterized.parameters(
         (
             (1000, 100, f, r, 10, nn_kwargs, kernel)
-            for f in [100, 1]
-            for r in [5, 1]
+            # Kin and Kcross do not depend upon the response count
+            for f, r in [(100, 5), (1, 1)]
             for nn_kwargs in _basic_nn_kwarg_options
             # for f in [1]
             # for r in [1]
@@ -543,29 +611,32 @@ class GPSolveTest(GPTestCase):
         # validate
         self.assertEqual(responses.shape, (test_count,))
 
-        for i in range(test_count):
-            manual_responses = mm.squeeze(
-                Kcross[i, :]
-                @ mm.linalg.solve(
-                    Kin[i, :, :] + muygps.noise() * mm.eye(nn_count),
-                    train_responses[test_nn_indices[i]],
-                )
-            )
-            _check_ndarray(self.assertEqual, manual_responses, mm.ftype)
-            _consistent_assert(
-                _precision_assert,
-                self.assertAlmostEquals,
-                responses[i],
-                manual_responses,
+        # solve all of the neighborhood systems in one batched call
+        manual_responses = mm.squeeze(
+            mm.einsum(
+                "bi,bir->br",
+                Kcross,
+                mm.linalg.solve(
+                    Kin + muygps.noise() * mm.eye(nn_count),
+                    train_responses[test_nn_indices],
+                ),
             )
+        )
+        _check_ndarray(self.assertEqual, manual_responses, mm.ftype)
+        _precision_assert(
+            _consistent_assert,
+            self._assert_all_almost_equal,
+            responses,
+            manual_responses,
+        )
 
 
 class GPDiagonalVariance(GPTestCase):
     @parameterized.parameters(
         (
             (1000, 100, f, r, 10, nn_kwargs, kwargs)
-            for f in [100, 1]
-            for r in [10, 2, 1]
+            # the posterior variance does not depend upon the response count
+            for f, r in [(100, 10), (1, 1)]
             for nn_kwargs in _basic_nn_kwarg_options
             # for f in [1]
             # for r in [10]
@@ -609,23 +680,26 @@ class GPDiagonalVariance(GPTestCase):
 
         # validate
         self.assertEqual(diagonal_variance.shape, (test_count,))
-        for i in range(test_count):
-            manual_diagonal_variance = mm.squeeze(
-                mm.array(1.0)
-                - Kcross[i, :]
-                @ mm.linalg.solve(
-                    Kin[i, :, :] + muygps.noise() * mm.eye(nn_count),
-                    Kcross[i, :],
-                )
-            )
-            self.assertEqual(manual_diagonal_variance.dtype, mm.ftype)
-            _precision_assert(
-                _consistent_assert,
-                self.assertAlmostEqual,
-                diagonal_variance[i],
-                manual_diagonal_variance,
-            )
-            self.assertGreater(diagonal_variance[i], 0.0)
+        # solve all of the neighborhood systems in one batched call
+        manual_diagonal_variance = mm.array(1.0) - mm.einsum(
+            "bi,bi->b",
+            Kcross,
+            mm.squeeze(
+                mm.linalg.solve(
+                    Kin + muygps.noise() * mm.eye(nn_count),
+                    Kcross[:, :, None],
+                ),
+                axis=-1,
+            ),
+        )
+        self.assertEqual(manual_diagonal_variance.dtype, mm.ftype)
+        _precision_assert(
+            _consistent_assert,
+            self._assert_all_almost_equal,
+            diagonal_variance,
+            manual_diagonal_variance,
+        )
+        self.assertTrue(mm.all(diagonal_variance > 0.0))
 
 
 class MakeClassifierTest(parameterized.TestCase):
@@ -790,6 +864,29 @@ class MakeRegressorTest(parameterized.TestCase):
 
 
 class GPScaleTest(GPTestCase):
+    def _get_batch_fixture(
+        self, data_count, feature_count, nn_count, nn_kwargs
+    ):
+        return self._cached_fixture(
+            self._make_batch_fixture,
+            (data_count, feature_count),
+            nn_count,
+            nn_kwargs,
+        )
+
+    @staticmethod
+    def _make_batch_fixture(
+        data_count, feature_count, nn_count, nn_kwargs, rng
+    ):
+        # prepare data
+        data = _make_gaussian_dict(data_count, feature_count, 1, rng=rng)
+
+        # neighbors
+        nbrs_lookup = NN_Wrapper(data["input"], nn_count, **nn_kwargs)
+        indices = mm.arange(data_count)
+        nn_indices, _ = nbrs_lookup.get_batch_nns(indices)
+        return data, nn_indices, indices
+
     @parameterized.parameters(
         (
             (1000, f, 10, nn_kwargs, k_kwargs)
@@ -822,13 +919,11 @@ class GPScaleTest(GPTestCase):
 
         print("TODO - add MultiScale test")
 
-        # prepare data
-        data = _make_gaussian_dict(data_count, feature_count, 1)
+        data, nn_indices, indices = self._get_batch_fixture(
+            data_count, feature_count, nn_count, nn_kwargs
+        )
 
-        # neighbors and differences
-        nbrs_lookup = NN_Wrapper(data["input"], nn_count, **nn_kwargs)
-        indices = mm.arange(data_count)
-        nn_indices, _ = nbrs_lookup.get_batch_nns(indices)
+        # differences
         (_, pairwise_diffs, _, nn_targets) = muygps.make_train_tensors(
             indices,
             nn_indices,
@@ -525,6 +525,120 @@ class MaternTest(KernelTestCase):
         _check_ndarray(self.assertEqual, Kcross, mm.ftype)
         self.assertTrue(mm.allclose(Kcross, Kcross_sk))
 
+    @parameterized.parameters(
+        (
+            (100, 10, 10, 10, old_smoothness, new_smoothness)
+            for old_smoothness in [0.5, 2.5]
+            for new_smoothness in [0.5, 1.5, mm.inf]
+        )
+    )
+    def test_set_smoothness(
+        self,
+        train_count,
+        feature_count,
+        nn_count,
+        test_count,
+        old_smoothness,
+        new_smoothness,
+    ):
+        train = _make_gaussian_matrix(train_count, feature_count)
+        test = _make_gaussian_matrix(test_count, feature_count)
+        nbrs_lookup = NN_Wrapper(train, nn_count, **_basic_nn_kwarg_options[0])
+        nn_indices, _ = nbrs_lookup.get_nns(test)
+        mtn = Matern(
+            smoothness=ScalarParam(old_smoothness),
+            deformation=Isotropy(l2, length_scale=ScalarParam(0.5)),
+        )
+        mtn.set_params(smoothness=ScalarParam(new_smoothness))
+        self.assertEqual(mtn.smoothness(), new_smoothness)
+        ref_mtn = Matern(
+            smoothness=ScalarParam(new_smoothness),
+            deformation=Isotropy(l2, length_scale=ScalarParam(0.5)),
+        )
+        pairwise_diffs = mtn.deformation.pairwise_tensor(train, nn_indices)
+        _consistent_assert(
+            self.assertTrue,
+            mm.allclose(mtn(pairwise_diffs), ref_mtn(pairwise_diffs)),
+        )
+
+    def _make_small_kernels(
+        self, mtn, batch_count=10, nn_count=5, feature_count=3, scale=1.0
+    ):
+        # neighborhoods are disjoint blocks of the training data, so that Kin
+        # has exact zeros on its diagonals
+        train = scale * _make_gaussian_matrix(
+            batch_count * nn_count, feature_count
+        )
+        test = scale * _make_gaussian_matrix(batch_count, feature_count)
+        nn_indices = mm.iarray(
+            np.arange(batch_count * nn_count).reshape(batch_count, nn_count)
+        )
+        pairwise_diffs = mtn.deformation.pairwise_tensor(train, nn_indices)
+        crosswise_diffs = mtn.deformation.crosswise_tensor(
+            test, train, np.arange(batch_count), nn_indices
+        )
+        Kin = _consistent_unchunk_tensor(mtn(pairwise_diffs))
+        Kcross = mtn(crosswise_diffs)
+        return Kin, Kcross
+
+    @parameterized.parameters((smoothness,) for smoothness in [0.42, 3.7])
+    def test_matern_gen_dtype(self, smoothness):
+        if config.state.backend == "torch":
+            _warn0(
+                "Skipping test because torch cannot handle Matern "
+                f"smoothness={smoothness}"
+            )
+            return
+        mtn = Matern(
+            smoothness=ScalarParam(smoothness),
+            deformation=Isotropy(l2, length_scale=ScalarParam(0.5)),
+        )
+        Kin, Kcross = self._make_small_kernels(mtn)
+        # neither the symmetric nor the crosswise path may promote the
+        # configured float type
+        _check_ndarray(self.assertEqual, Kin, mm.ftype)
+        _check_ndarray(self.assertEqual, Kcross, mm.ftype)
+
+    @parameterized.parameters((smoothness,) for smoothness in [0.42, 20, 50])
+    def test_matern_gen_zero_distance(self, smoothness):
+        if config.state.backend == "torch":
+            _warn0(
+                "Skipping test because torch cannot handle Matern "
+                f"smoothness={smoothness}"
+            )
+            return
+        mtn = Matern(
+            smoothness=ScalarParam(smoothness),
+            deformation=Isotropy(l2, length_scale=ScalarParam(0.5)),
+        )
+        Kin, _ = self._make_small_kernels(mtn, nn_count=5)
+        # the Bessel function overflows at zero distance for large smoothness,
+        # but the kernel's limit there is exactly one
+        self.assertLessEqual(mm.max(Kin), 1.0)
+        self.assertTrue(mm.all(Kin[:, mm.arange(5), mm.arange(5)] == 1.0))
+
+    @parameterized.parameters(
+        (smoothness,) for smoothness in [0.42, 20, 200, 1000]
+    )
+    def test_matern_gen_large_smoothness(self, smoothness):
+        if config.state.backend not in ["numpy", "mpi"]:
+            _warn0(
+                f"Skipping test because {config.state.backend} does not "
+                f"handle Matern smoothness={smoothness} at small distances"
+            )
+            return
+        mtn = Matern(
+            smoothness=ScalarParam(smoothness),
+            deformation=Isotropy(l2, length_scale=ScalarParam(0.5)),
+        )
+        # the Bessel function overflows at small nonzero distances for large
+        # smoothness, where the kernel nonetheless lies in [0, 1]
+        Kin, Kcross = self._make_small_kernels(mtn, scale=1e-2)
+        for K in (Kin, Kcross):
+            self.assertTrue(np.all(np.isfinite(K)))
+            self.assertLessEqual(np.max(K), 1.0)
+            self.assertGreaterEqual(np.min(K), 0.0)
+
 
 class AnisotropicShapesTest(KernelTestCase):
     @parameterized.parameters(